@@ -18,7 +18,11 @@
 
 import ctypes as ct
 
+# private names, as the package re-exports this module with *
+from collections import deque as _deque
 from enum import IntEnum, IntFlag
+from itertools import product as _product
+from threading import local as _thread_local
 
 
 class ProtocolID(IntEnum):
@@ -195,6 +199,30 @@ class IoctlParameter(IntEnum):
     ISO15765_WFT_MAX    = 0x25
 
 
+def _lookup(enum_type, value):
+    """Get the member of ``enum_type`` with the given value.
+
+    Checks the enum's value-to-member map directly before falling back
+    to the (much slower) enum constructor, which is still needed for
+    :class:`~enum.IntFlag` combinations and to raise on invalid values.
+    """
+    try:
+        return enum_type._value2member_map_[value]
+    except KeyError:
+        return enum_type(value)
+
+
+# every combination of RxFlags mapped to its RxStatus, or to the
+# combined RxFlags when there is no matching RxStatus
+_rx_status_map = {
+    value: (
+        RxStatus(value) if value in RxStatus._value2member_map_
+        else RxFlags(value)
+    )
+    for value in (sum(bits) for bits in _product(*((0, f) for f in RxFlags)))
+}
+
+
 class PASSTHRU_MSG(ct.Structure):
     _fields_ = [
         ("_ProtocolID"       , ct.c_ulong),
@@ -206,6 +234,15 @@ class PASSTHRU_MSG(ct.Structure):
         ("_Data"             , ct.c_ubyte*4128),
     ]
 
+    # free-list of released messages, see :meth:`acquire`/:meth:`release`
+    _pool = _deque(maxlen=256)
+
+    # set while a message sits in the pool, to catch double releases
+    _pooled = False
+
+    # per-thread reusable message, see :meth:`scratch`
+    _scratch = _thread_local()
+
     def __init__(self, *args, **kwargs):
         """Initializer.
 
@@ -231,53 +268,158 @@ class PASSTHRU_MSG(ct.Structure):
 
         # standard initializer
         else:
-            protocol = args[0]
-            tx_flags = kwargs.pop('tx_flags', TxFlags.TX_NORMAL_TRANSMIT)
+            protocol = int(args[0])
+            tx_flags = int(
+                kwargs.pop('tx_flags', TxFlags.TX_NORMAL_TRANSMIT)
+            )
             data = kwargs.pop('data', b'')
 
-            data_arr = (ct.c_ubyte*4128)(*data)
+            if not isinstance(data, bytes):
+                data = bytes(data)
+            if len(data) > len(self._Data):
+                raise ValueError(
+                    '`data` must be at most {} bytes'.format(len(self._Data))
+                )
+
+            # leave `_Data` zero-initialized and copy the payload in directly
             super(PASSTHRU_MSG, self).__init__(
-                protocol, 0x0, tx_flags, 0, len(data), len(data), data_arr
+                protocol, 0x0, tx_flags, 0, len(data), len(data)
             )
+            ct.memmove(self._Data, data, len(data))
+
+    @classmethod
+    def acquire(cls):
+        """Get an empty message, reusing a released one if available.
+
+        Intended for receive loops that would otherwise allocate a new
+        message container on every poll, e.g. with
+        ``PassThruReadMsgsInto(channel_id, msg)``. Once the contents of
+        the message have been extracted (e.g. via :attr:`Data`), hand
+        it back with :meth:`release`.
+
+        Returns:
+            :class:`.PASSTHRU_MSG`: A zeroed message container
+        """
+        try:
+            msg = cls._pool.pop()
+        except IndexError:
+            return cls()
+        msg._pooled = False
+        return msg
+
+    @classmethod
+    def scratch(cls):
+        """Get this thread's reusable message, zeroed.
+
+        Each thread gets a single message that is zeroed and handed out
+        again on every call, for loops that read one message at a time
+        and discard it, e.g. via ``PassThruReadMsgsInto(channel_id,
+        PASSTHRU_MSG.scratch())``. The previous contents are lost on
+        each call, so copy out anything that needs to be kept first.
+
+        Returns:
+            :class:`.PASSTHRU_MSG`: A zeroed message container
+        """
+        msg = getattr(cls._scratch, 'msg', None)
+        if msg is None:
+            msg = cls._scratch.msg = cls()
+        else:
+            ct.memset(ct.addressof(msg), 0, ct.sizeof(msg))
+        return msg
+
+    def release(self):
+        """Zero this message and return it to the pool.
+
+        The message must not be used by the caller after it has been
+        released.
+
+        Raises:
+            ValueError: If the message has already been released, does
+                not own its memory (e.g. an element of a message array),
+                or is this thread's :meth:`scratch` message
+        """
+        if self._pooled:
+            raise ValueError('message has already been released')
+        if self._b_base_ is not None:
+            raise ValueError('message does not own its memory')
+        if getattr(type(self)._scratch, 'msg', None) is self:
+            raise ValueError('scratch messages cannot be released')
+        self._pooled = True
+        ct.memset(ct.addressof(self), 0, ct.sizeof(self))
+        type(self)._pool.append(self)
+
+    def __eq__(self, other):
+        """Compare the header and populated payload of two messages."""
+        if not isinstance(other, PASSTHRU_MSG):
+            return NotImplemented
+        if self.DataSize != other.DataSize:
+            return False
+        size = _MSG_DATA_OFFSET + min(self.DataSize, _MSG_DATA_SIZE)
+        mine = ct.string_at(ct.addressof(self), size)
+        theirs = ct.string_at(ct.addressof(other), size)
+        return mine == theirs
 
     @property
     def ProtocolID(self):
-        return ProtocolID(self._ProtocolID)
+        return _lookup(ProtocolID, self._ProtocolID)
 
     @property
     def RxStatus(self):
-        return RxStatus(self._RxStatus)
+        """Receive status of the message.
+
+        Returns:
+            :class:`.RxStatus` if the status matches one of its members,
+            otherwise the :class:`.RxFlags` that are set.
+        """
+        try:
+            return _rx_status_map[self._RxStatus]
+        except KeyError:
+            return RxFlags(self._RxStatus)
 
     @property
     def TxFlags(self):
-        return TxFlags(self._TxFlags)
+        return _lookup(TxFlags, self._TxFlags)
 
     @property
-    def Timestamp(self):
-        return self.Timestamp
+    def Data(self):
+        size = min(self.ExtraDataIndex, _MSG_DATA_SIZE)
+        return ct.string_at(ct.addressof(self) + _MSG_DATA_OFFSET, size)
 
     @property
-    def DataSize(self):
-        return self.DataSize
+    def DataView(self):
+        """Zero-copy, writable view of :attr:`Data`.
 
-    @property
-    def ExtraDataIndex(self):
-        return self.ExtraDataIndex
+        Unlike :attr:`Data`, no copy of the payload is made, so the view
+        reflects any later changes to the message, including it being
+        reused by :meth:`release`. Copy out anything that needs to
+        outlive the message.
 
-    @property
-    def Data(self):
-        return bytes(self._Data[:self.ExtraDataIndex])
+        The view can be handed to anything accepting the buffer
+        protocol without a copy, e.g.
+        ``numpy.frombuffer(msg.DataView, dtype=numpy.uint8)`` to run
+        vectorized checksums over the payload.
+
+        Returns:
+            memoryview: View of the message payload
+        """
+        return memoryview(self._Data).cast('B')[:self.ExtraDataIndex]
 
     @property
     def ExtraData(self):
-        if self.ExtraDataIndex == self.DataSize:
+        start = min(self.ExtraDataIndex, _MSG_DATA_SIZE)
+        end = min(self.DataSize, _MSG_DATA_SIZE)
+        if start >= end:
             return b''
         else:
-            return bytes(
-                self._Data[self.ExtraDataIndex:self.DataSize]
+            return ct.string_at(
+                ct.addressof(self) + _MSG_DATA_OFFSET + start, end - start
             )
 
 
+_MSG_DATA_OFFSET = PASSTHRU_MSG._Data.offset
+_MSG_DATA_SIZE = PASSTHRU_MSG._Data.size
+
+
 class SCONFIG(ct.Structure):
     """Ioctl interface config parameter structure.
 
@@ -291,7 +433,7 @@ class SCONFIG(ct.Structure):
 
     @property
     def Parameter(self):
-        return IoctlParameter(self._Parameter)
+        return _lookup(IoctlParameter, self._Parameter)
 
 
 class SCONFIG_LIST(ct.Structure):
@@ -303,16 +445,22 @@ class SCONFIG_LIST(ct.Structure):
     def __init__(self, sconfig_arr):
         """Initializer.
 
-        Initialize with a ``list`` of :class:`.SCONFIG` instances.
+        Initialize with a ``list`` of :class:`.SCONFIG` instances, or a
+        ctypes ``SCONFIG`` array, which is used in place without copying.
         """
-        Config = (SCONFIG*len(sconfig_arr))(*sconfig_arr)
-        super(SCONFIG_LIST, self).__init__(
-            len(sconfig_arr), ct.cast(Config, ct.POINTER(SCONFIG))
-        )
+        if isinstance(sconfig_arr, ct.Array):
+            Config = sconfig_arr
+        else:
+            Config = (SCONFIG*len(sconfig_arr))(*sconfig_arr)
+        super(SCONFIG_LIST, self).__init__(len(Config), Config)
 
     @property
     def Config(self):
-        return [self.ConfigPtr[x] for x in range(self.NumOfParams)]
+        if not self.ConfigPtr:
+            return (SCONFIG*0)()
+        return ct.cast(
+            self.ConfigPtr, ct.POINTER(SCONFIG*self.NumOfParams)
+        ).contents
 
 
 class SBYTE_ARRAY(ct.Structure):
@@ -324,6 +472,25 @@ class SBYTE_ARRAY(ct.Structure):
     def __init__(self, byte_arr=b'\x00'):
         """Initializer.
 
-        Initialize with a ``bytes`` or ``bytearray``.
+        Initialize with a ``bytes``, ``bytearray`` or ``memoryview``, or
+        any iterable of ints. The bytes are copied into a buffer owned by
+        this structure, so it stays valid for as long as the structure
+        does and can be written to by the DLL when used as an output
+        parameter.
         """
-        super(SBYTE_ARRAY, self).__init__(len(byte_arr), byte_arr)
+        if isinstance(byte_arr, memoryview) and not byte_arr.c_contiguous:
+            # cast() needs contiguous memory, so gather a copy instead
+            byte_arr = bytes(byte_arr)
+        elif isinstance(byte_arr, memoryview):
+            # count bytes rather than items of a wider format
+            byte_arr = byte_arr.cast('B')
+        elif not isinstance(byte_arr, (bytes, bytearray)):
+            byte_arr = bytes(byte_arr)
+        self._buf = (ct.c_char*len(byte_arr)).from_buffer_copy(byte_arr)
+        super(SBYTE_ARRAY, self).__init__(
+            len(byte_arr), ct.cast(self._buf, ct.c_char_p)
+        )
+
+    @property
+    def Bytes(self):
+        return self._buf.raw[:self.NumOfBytes]
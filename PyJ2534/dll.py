@@ -19,10 +19,14 @@
 import logging
 import platform
 import sys
+import threading
+import weakref
+
+from itertools import count
 
 from ctypes import (
-    byref, create_string_buffer, POINTER,
-    c_char_p, c_ulong, c_void_p
+    byref, create_string_buffer, sizeof, Array, POINTER,
+    c_char_p, c_long, c_ulong, c_void_p
 )
 
 from .define import (
@@ -34,10 +38,191 @@ from .error import LoadDLLError, J2534Errors, J2534Error
 _logger = logging.getLogger(__name__)
 _platform = platform.architecture()[1].lower()
 
+if 'win' in _platform:
+    import winreg
+    from ctypes import WinDLL
+else:
+    # leave the module importable elsewhere, e.g. for building the docs
+    winreg = WinDLL = None
+
+# result of the last registry enumeration, see :func:`get_interfaces`
+_interfaces = None
+
+# annotated DLLs by path, shared by all wrappers of the same DLL
+_dlls = weakref.WeakValueDictionary()
+
+# programming voltages accepted in addition to MIN_VOLTAGE-MAX_VOLTAGE
+_voltage_switches = frozenset([
+    ProgrammingVoltage.SHORT_TO_GROUND,
+    ProgrammingVoltage.VOLTAGE_OFF,
+])
+_voltage_error = '`voltage` must be between {} and {}'.format(
+    ProgrammingVoltage.MIN_VOLTAGE.value,
+    ProgrammingVoltage.MAX_VOLTAGE.value
+)
+
+# largest per-thread message buffer kept between calls, ~1 MB
+_max_cached_msgs = 256
+
+# config parameters that are not used by J2534-1 v04.04 interfaces
+_unused_params = frozenset([
+    IoctlParameter.P1_MIN,
+    IoctlParameter.P2_MIN,
+    IoctlParameter.P2_MAX,
+    IoctlParameter.P3_MAX,
+    IoctlParameter.P4_MAX,
+])
+
+
+# J2534-1 API function prototypes, as (name, argtypes) pairs
+_func_defs = (
+    # extern "C" long WINAPI PassThruOpen (
+    #   void *pName
+    #   unsigned long *pDeviceID
+    # )
+    ('PassThruOpen', (c_void_p, POINTER(c_ulong))),
+    # extern "C" long WINAPI PassThruClose (
+    #   unsigned long DeviceID
+    # )
+    ('PassThruClose', (c_ulong,)),
+    # extern "C" long WINAPI PassThruConnect (
+    #   unsigned long DeviceID,
+    #   unsigned long ProtocolID,
+    #   unsigned long Flags,
+    #   unsigned long BaudRate,
+    #   unsigned long *pChannelID
+    # )
+    ('PassThruConnect', (
+        c_ulong, c_ulong, c_ulong, c_ulong, POINTER(c_ulong)
+    )),
+    # extern "C" long WINAPI PassThruDisconnect (
+    #   unsigned long ChannelID
+    # )
+    ('PassThruDisconnect', (c_ulong,)),
+    # extern "C" long WINAPI PassThruReadMsgs (
+    #   unsigned long ChannelID,
+    #   PASSTHRU_MSG *pMsg,
+    #   unsigned long *pNumMsgs,
+    #   unsigned long Timeout
+    # )
+    ('PassThruReadMsgs', (
+        c_ulong,
+        POINTER(PASSTHRU_MSG),
+        POINTER(c_ulong),
+        c_ulong
+    )),
+    # extern "C" long WINAPI PassThruWriteMsgs (
+    #   unsigned long ChannelID,
+    #   PASSTHRU_MSG *pMsg,
+    #   unsigned long *pNumMsgs,
+    #   unsigned long Timeout
+    # )
+    ('PassThruWriteMsgs', (
+        c_ulong,
+        POINTER(PASSTHRU_MSG),
+        POINTER(c_ulong),
+        c_ulong
+    )),
+    # extern "C" long WINAPI PassThruStartPeriodicMsg (
+    #   unsigned long ChannelID,
+    #   PASSTHRU_MSG *pMsg,
+    #   unsigned long *pMsgID,
+    #   unsigned long TimeInterval
+    # )
+    ('PassThruStartPeriodicMsg', (
+        c_ulong,
+        POINTER(PASSTHRU_MSG),
+        POINTER(c_ulong),
+        c_ulong
+    )),
+    # extern "C" long WINAPI PassThruStopPeriodicMsg (
+    #   unsigned long ChannelID,
+    #   unsigned long MsgID
+    # )
+    ('PassThruStopPeriodicMsg', (c_ulong, c_ulong)),
+    # extern "C" long WINAPI PassThruStartMsgFilter (
+    #   unsigned long ChannelID,
+    #   unsigned long FilterType,
+    #   PASSTHRU_MSG *pMaskMsg,
+    #   PASSTHRU_MSG *pPatternMsg,
+    #   PASSTHRU_MSG *pFlowControlMsg,
+    #   unsigned long *pFilterID
+    # )
+    ('PassThruStartMsgFilter', (
+        c_ulong,
+        c_ulong,
+        POINTER(PASSTHRU_MSG),
+        POINTER(PASSTHRU_MSG),
+        POINTER(PASSTHRU_MSG),
+        POINTER(c_ulong)
+    )),
+    # extern "C" long WINAPI PassThruStopMsgFilter (
+    #   unsigned long ChannelID,
+    #   unsigned long FilterID
+    # )
+    ('PassThruStopMsgFilter', (c_ulong, c_ulong)),
+    # extern "C" long WINAPI PassThruSetProgrammingVoltage (
+    #   unsigned long DeviceID,
+    #   unsigned long PinNumber,
+    #   unsigned long Voltage
+    # )
+    ('PassThruSetProgrammingVoltage', (c_ulong, c_ulong, c_ulong)),
+    # extern "C" long WINAPI PassThruReadVersion (
+    #   unsigned long DeviceID
+    #   char *pFirmwareVersion,
+    #   char *pDllVersion,
+    #   char *pApiVersion
+    # )
+    ('PassThruReadVersion', (c_ulong, c_char_p, c_char_p, c_char_p)),
+    # extern "C" long WINAPI PassThruGetLastError (
+    #   char   *pErrorDescription
+    # )
+    ('PassThruGetLastError', (c_char_p,)),
+    # extern "C" long WINAPI PassThruIoctl (
+    #   unsigned long ChannelID,
+    #   unsigned long IoctlID,
+    #   void *pInput,
+    #   void *pOutput
+    # )
+    ('PassThruIoctl', (c_ulong, c_ulong, c_void_p, c_void_p)),
+)
+
+
+# return codes checked on every call, as plain ints
+_status_noerror = J2534Errors.STATUS_NOERROR.value
+_buffer_empty = J2534Errors.ERR_BUFFER_EMPTY.value
+
+
+def _error_check(result, func, arguments):
+    """Default callback for J2534 DLL function calls."""
+    if result != _status_noerror:
+        raise J2534Error(result)
+
+
+def _read_check(result, func, arguments):
+    """Callback for a J2534 :func:`PassThruReadMsgs` call."""
+    if result != _buffer_empty:
+        _error_check(result, func, arguments)
+    return result
+
 
-def get_interfaces():
+# functions that don't use the default error check, None for no check
+_errchecks = {
+    'PassThruReadMsgs': _read_check,
+    'PassThruGetLastError': None,
+}
+
+
+def get_interfaces(refresh=False):
     """Enumerate all registered J2534 04.04 Pass-Thru interface DLLs
 
+    The registry is only walked on the first call; later calls return
+    the cached result unless ``refresh`` is set.
+
+    Args:
+        refresh (bool): Re-enumerate the registry, e.g. after a
+            Pass-Thru driver has been installed or removed.
+
     Returns:
         dict: A dict mapping display names of any registered J2534
         Pass-Thru DLLs to their absolute filepath.
@@ -48,10 +233,13 @@ def get_interfaces():
         :class:`J2534Dll` wrapping the desired DLL.
     """
 
-    if 'win' not in _platform:
+    global _interfaces
+
+    if _interfaces is not None and not refresh:
+        return dict(_interfaces)
+
+    if winreg is None:
         raise RuntimeError('PyJ2534 currently only supports Windows')
-    else:
-        import winreg
 
     ret = {}
 
@@ -61,16 +249,48 @@ def get_interfaces():
         r"Software\\PassThruSupport.04.04\\"
     )
 
-    BaseKey = winreg.OpenKeyEx(winreg.HKEY_LOCAL_MACHINE, _passthru_key)
-    count = winreg.QueryInfoKey(BaseKey)[0]
+    with winreg.OpenKeyEx(winreg.HKEY_LOCAL_MACHINE, _passthru_key) as BaseKey:
+        # enumerate subkeys until EnumKey runs out (ERROR_NO_MORE_ITEMS)
+        for i in count():
+            try:
+                DeviceName = winreg.EnumKey(BaseKey, i)
+            except OSError:
+                break
+
+            with winreg.OpenKeyEx(BaseKey, DeviceName) as DeviceKey:
+                Name = winreg.QueryValueEx(DeviceKey, "Name")[0]
+                FunctionLibrary = winreg.QueryValueEx(
+                    DeviceKey, "FunctionLibrary"
+                )[0]
+            ret[Name] = FunctionLibrary
+
+    _interfaces = ret
+    return dict(ret)
+
 
-    for i in range(count):
-        DeviceKey = winreg.OpenKeyEx(BaseKey, winreg.EnumKey(BaseKey, i))
-        Name = winreg.QueryValueEx(DeviceKey, "Name")[0]
-        FunctionLibrary = winreg.QueryValueEx(DeviceKey, "FunctionLibrary")[0]
-        ret[Name] = FunctionLibrary
+def _load_dll(dll_path):
+    """Load the DLL at ``dll_path`` and annotate its J2534 functions.
 
-    return ret
+    DLLs are cached by path while any wrapper still uses them, so the
+    annotation is only done once per DLL.
+    """
+    dll = _dlls.get(dll_path)
+    if dll is None:
+        dll = WinDLL(dll_path)
+
+        # annotate all DLL functions
+        for func, argtypes in _func_defs:
+            f = getattr(dll, func)
+            f.argtypes = argtypes
+            # plain int, only resolved to J2534Errors by J2534Error
+            f.restype = c_long
+            errcheck = _errchecks.get(func, _error_check)
+            if errcheck is not None:
+                f.errcheck = errcheck
+
+        _dlls[dll_path] = dll
+
+    return dll
 
 
 def load_interface(dll_path):
@@ -93,178 +313,29 @@ class J2534Dll(object):
     All functions raise a :class:`.J2534Error` if an error occurs.
     """
 
+    # the DLL, per-thread buffers and the bound DLL functions, keeping
+    # instances weak-referenceable
+    __slots__ = ('__weakref__', '_dll', '_local') + tuple(
+        '_' + f for f, _ in _func_defs
+    )
+
     def __init__(self, dll_path):
         """Instantiate a wrapper to the DLL at the given filepath."""
 
-        try:
-            if 'win' not in _platform:
-                raise RuntimeError('PyJ2534 currently only supports Windows')
-            else:
-                from ctypes import WinDLL
-
-            self._dll = WinDLL(dll_path)
+        if WinDLL is None:
+            raise RuntimeError('PyJ2534 currently only supports Windows')
 
+        try:
+            self._dll = _load_dll(dll_path)
         except WindowsError:
             raise LoadDLLError
 
-        _func_defs = {
-            # extern "C" long WINAPI PassThruOpen (
-            #   void *pName
-            #   unsigned long *pDeviceID
-            # )
-            'PassThruOpen': {
-                'argtypes': (c_void_p, POINTER(c_ulong)),
-            },
-            # extern "C" long WINAPI PassThruClose (
-            #   unsigned long DeviceID
-            # )
-            'PassThruClose': {
-                'argtypes': (c_ulong,),
-            },
-            # extern "C" long WINAPI PassThruConnect (
-            #   unsigned long DeviceID,
-            #   unsigned long ProtocolID,
-            #   unsigned long Flags,
-            #   unsigned long BaudRate,
-            #   unsigned long *pChannelID
-            # )
-            'PassThruConnect': {
-                'argtypes': (
-                    c_ulong, c_ulong, c_ulong, c_ulong, POINTER(c_ulong)
-                ),
-            },
-            # extern "C" long WINAPI PassThruDisconnect (
-            #   unsigned long ChannelID
-            # )
-            'PassThruDisconnect': {
-                'argtypes': (c_ulong,),
-            },
-            # extern "C" long WINAPI PassThruReadMsgs (
-            #   unsigned long ChannelID,
-            #   PASSTHRU_MSG *pMsg,
-            #   unsigned long *pNumMsgs,
-            #   unsigned long Timeout
-            # )
-            'PassThruReadMsgs': {
-                'argtypes': (
-                    c_ulong,
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(c_ulong),
-                    c_ulong
-                ),
-                'errcheck': self._read_check,
-            },
-            # extern "C" long WINAPI PassThruWriteMsgs (
-            #   unsigned long ChannelID,
-            #   PASSTHRU_MSG *pMsg,
-            #   unsigned long *pNumMsgs,
-            #   unsigned long Timeout
-            # )
-            'PassThruWriteMsgs': {
-                'argtypes': (
-                    c_ulong,
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(c_ulong),
-                    c_ulong
-                ),
-            },
-            # extern "C" long WINAPI PassThruStartPeriodicMsg (
-            #   unsigned long ChannelID,
-            #   PASSTHRU_MSG *pMsg,
-            #   unsigned long *pMsgID,
-            #   unsigned long TimeInterval
-            # )
-            'PassThruStartPeriodicMsg': {
-                'argtypes': (
-                    c_ulong,
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(c_ulong),
-                    c_ulong
-                ),
-            },
-            # extern "C" long WINAPI PassThruStopPeriodicMsg (
-            #   unsigned long ChannelID,
-            #   unsigned long MsgID
-            # )
-            'PassThruStopPeriodicMsg': {
-                'argtypes': (c_ulong, c_ulong),
-            },
-            # extern "C" long WINAPI PassThruStartMsgFilter (
-            #   unsigned long ChannelID,
-            #   unsigned long FilterType,
-            #   PASSTHRU_MSG *pMaskMsg,
-            #   PASSTHRU_MSG *pPatternMsg,
-            #   PASSTHRU_MSG *pFlowControlMsg,
-            #   unsigned long *pFilterID
-            # )
-            'PassThruStartMsgFilter': {
-                'argtypes': (
-                    c_ulong,
-                    c_ulong,
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(PASSTHRU_MSG),
-                    POINTER(c_ulong)
-                ),
-            },
-            # extern "C" long WINAPI PassThruStopMsgFilter (
-            #   unsigned long ChannelID,
-            #   unsigned long FilterID
-            # )
-            'PassThruStopMsgFilter': {
-                'argtypes': (c_ulong, c_ulong),
-            },
-            # extern "C" long WINAPI PassThruSetProgrammingVoltage (
-            #   unsigned long DeviceID,
-            #   unsigned long PinNumber,
-            #   unsigned long Voltage
-            # )
-            'PassThruSetProgrammingVoltage': {
-                'argtypes': (c_ulong, c_ulong, c_ulong),
-            },
-            # extern "C" long WINAPI PassThruReadVersion (
-            #   unsigned long DeviceID
-            #   char *pFirmwareVersion,
-            #   char *pDllVersion,
-            #   char *pApiVersion
-            # )
-            'PassThruReadVersion': {
-                'argtypes': (c_ulong, c_char_p, c_char_p, c_char_p),
-            },
-            # extern "C" long WINAPI PassThruGetLastError (
-            #   char   *pErrorDescription
-            # )
-            'PassThruGetLastError': {
-                'argtypes': (c_char_p,),
-                'errcheck': lambda x, y, z: None, # no callback
-            },
-            # extern "C" long WINAPI PassThruIoctl (
-            #   unsigned long ChannelID,
-            #   unsigned long IoctlID,
-            #   void *pInput,
-            #   void *pOutput
-            # )
-            'PassThruIoctl': {
-                'argtypes': (c_ulong, c_ulong, c_void_p, c_void_p),
-            }
-        }
-        _default_restype = J2534Errors
-        _default_errcheck = self._error_check
+        # per-thread message buffers reused across read/write calls
+        self._local = threading.local()
 
-        # annotate all DLL functions
-        for func in _func_defs:
-            fdef = _func_defs[func]
-            f = self._dll.__getattr__(func)
-
-            # set default return types and callback functions
-            if 'restype' not in fdef:
-                fdef['restype'] = _default_restype
-            if 'errcheck' not in fdef:
-                fdef['errcheck'] = _default_errcheck
-
-            # commit annotation
-            for key, val in fdef.items():
-                f.__setattr__(key, val)
+        # bind directly to skip the DLL attribute lookup on each call
+        for func, _ in _func_defs:
+            setattr(self, '_' + func, getattr(self._dll, func))
 
     def __repr__(self):
         return '<{}: {}>'.format(
@@ -272,17 +343,57 @@ class J2534Dll(object):
             self._dll._name
         )
 
-    def _error_check(self, result, func, arguments):
-        """Default callback for J2534 DLL function calls."""
-        if result != J2534Errors.STATUS_NOERROR:
-            raise J2534Error(result)
+    def _msg_buffer(self, num_msgs):
+        """Get this thread's message buffer, sized for ``num_msgs``.
 
-    def _read_check(self, result, func, arguments):
-        """Callback for a J2534 :func:`PassThruReadMsgs` call."""
-        if result == J2534Errors.ERR_BUFFER_EMPTY:
-            return
-        else:
-            self._error_check(result, func, arguments)
+        The buffer and message count are reused across calls, so
+        nothing that is handed back to the caller may point into them.
+        Buffers for more than ``_max_cached_msgs`` messages are
+        allocated per call rather than kept.
+
+        Returns:
+            tuple: The message buffer, and a ``c_ulong`` message count
+            set to ``num_msgs``
+
+        Raises:
+            ValueError: If ``num_msgs`` is negative
+        """
+        if num_msgs < 0:
+            raise ValueError('`num_msgs` must not be negative')
+        if num_msgs > _max_cached_msgs:
+            return (PASSTHRU_MSG*num_msgs)(), c_ulong(num_msgs)
+
+        local = self._local
+        buf = getattr(local, 'msg_buf', None)
+        if buf is None or len(buf) < num_msgs:
+            buf = local.msg_buf = (PASSTHRU_MSG*num_msgs)()
+            local.num_msgs = c_ulong()
+        local.num_msgs.value = num_msgs
+        return buf, local.num_msgs
+
+    def _ioctl_read_value(self, handle, ioctl_id):
+        """Issue an ioctl that outputs a single ``unsigned long``."""
+        Output = c_ulong()
+        self._PassThruIoctl(handle, ioctl_id, None, byref(Output))
+        return Output.value
+
+    def _read_msgs(self, channel_id, Msg, NumMsgs, timeout):
+        """Read up to ``NumMsgs`` messages into ``Msg``.
+
+        Returns:
+            int: Number of messages read
+        """
+        if timeout is None or timeout < 0:
+            timeout = 0
+
+        ret = self._PassThruReadMsgs(
+            channel_id, Msg, NumMsgs, timeout
+        )
+
+        if ret == _buffer_empty:
+            return 0
+
+        return NumMsgs.value
 
     def PassThruOpen(self):
         """Open the Pass-Thru device.
@@ -291,7 +402,7 @@ class J2534Dll(object):
             int: Handle to the opened device
         """
         dev_id = c_ulong()
-        self._dll.PassThruOpen(c_void_p(), byref(dev_id))
+        self._PassThruOpen(c_void_p(), byref(dev_id))
         return dev_id
 
     def PassThruClose(self, device_id):
@@ -300,7 +411,7 @@ class J2534Dll(object):
         Args:
             device_id (int): Handle to the previously opened device
         """
-        self._dll.PassThruClose(device_id)
+        self._PassThruClose(device_id)
 
     def PassThruConnect(self, device_id, protocol, flags, baud):
         """Establish a Pass-Thru connection using the given device.
@@ -319,7 +430,7 @@ class J2534Dll(object):
             int: Handle to the opened channel
         """
         chan_id = c_ulong()
-        self._dll.PassThruConnect(
+        self._PassThruConnect(
             device_id,
             protocol,
             flags,
@@ -334,7 +445,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruDisconnect(channel_id)
+        self._PassThruDisconnect(channel_id)
 
     def PassThruReadMsgs(self, channel_id, num_msgs=1, timeout=None):
         """Read messages from the specified channel.
@@ -367,20 +478,41 @@ class J2534Dll(object):
             a timeout :class:`.J2534Error` if the timeout lapses before
             ``num_msgs`` messages have been read.
         """
-        Msg = (PASSTHRU_MSG*num_msgs)()
-        NumMsgs = c_ulong(num_msgs)
+        Msg, NumMsgs = self._msg_buffer(num_msgs)
+        read = self._read_msgs(channel_id, Msg, NumMsgs, timeout)
+
+        # copy the received messages out of the reused buffer
+        size = sizeof(PASSTHRU_MSG)
+        return [
+            PASSTHRU_MSG.from_buffer_copy(Msg, i*size)
+            for i in range(read)
+        ]
 
-        if timeout is None or timeout < 0:
-            timeout = 0
+    def PassThruReadMsgsInto(self, channel_id, buf, timeout=None):
+        """Read messages from the specified channel into ``buf``.
 
-        ret = self._dll.PassThruReadMsgs(
-            channel_id, byref(Msg[0]), byref(NumMsgs), timeout
-        )
+        Unlike :func:`PassThruReadMsgs`, no messages are allocated, so
+        the same buffer can be reused across reads.
 
-        return (
-            [] if ret == J2534Errors.ERR_BUFFER_EMPTY
-            else list(Msg)[:NumMsgs.value]
-        )
+        Args:
+            channel_id (int):
+                Handle to the previously opened channel
+            buf (:class:`.PASSTHRU_MSG` array, or :class:`.PASSTHRU_MSG`):
+                Caller-owned ctypes array, e.g. ``(PASSTHRU_MSG*N)()``.
+                Up to ``len(buf)`` messages are read into it. A single
+                message, e.g. from :meth:`.PASSTHRU_MSG.scratch`, is
+                read into as a buffer of length 1.
+            timeout (int):
+                Read timeout in ms, or None. See :func:`PassThruReadMsgs`.
+
+        Returns:
+            int: Number of messages read into the start of ``buf``
+        """
+        if isinstance(buf, PASSTHRU_MSG):
+            NumMsgs = c_ulong(1)
+        else:
+            NumMsgs = c_ulong(len(buf))
+        return self._read_msgs(channel_id, buf, NumMsgs, timeout)
 
     def PassThruWriteMsgs(self, channel_id, msgs, timeout=None):
         """Write messages to the specified channel.
@@ -392,7 +524,9 @@ class J2534Dll(object):
             channel_id (int):
                 Handle to the previously opened channel
             msgs (list):
-                list of :class:`.PASSTHRU_MSG` instances
+                list of :class:`.PASSTHRU_MSG` instances, or a
+                :class:`.PASSTHRU_MSG` array, which is passed to the DLL
+                without being copied
             timeout (int):
                 Write timeout in ms, or None
 
@@ -406,14 +540,17 @@ class J2534Dll(object):
             or a timeout :class:`.J2534Error` is raised if the timeout
             lapses before all provided messages have been transmitted.
         """
-        Msg = (PASSTHRU_MSG*len(msgs))(*msgs)
-        NumMsgs = c_ulong(len(msgs))
+        if isinstance(msgs, Array):
+            Msg, NumMsgs = msgs, c_ulong(len(msgs))
+        else:
+            Msg, NumMsgs = self._msg_buffer(len(msgs))
+            Msg[:len(msgs)] = msgs
 
         if timeout is None or timeout < 0:
             timeout = 0
 
-        self._dll.PassThruWriteMsgs(
-            channel_id, byref(Msg[0]), byref(NumMsgs), timeout
+        self._PassThruWriteMsgs(
+            channel_id, Msg, NumMsgs, timeout
         )
 
         return NumMsgs.value
@@ -433,12 +570,12 @@ class J2534Dll(object):
         Returns:
             int: Handle to the periodic message
         """
-        if interval not in range(5, 65536):
+        if not 5 <= interval <= 65535:
             raise ValueError('`interval` must be between 5-65535')
 
         MsgID = c_ulong()
 
-        self._dll.PassThruStartPeriodicMsg(
+        self._PassThruStartPeriodicMsg(
             channel_id, byref(msg), byref(MsgID), interval
         )
 
@@ -453,7 +590,7 @@ class J2534Dll(object):
             msg_id (int):
                 Handle to the periodic message to stop
         """
-        self._dll.PassThruStopPeriodicMsg(channel_id, msg_id)
+        self._PassThruStopPeriodicMsg(channel_id, msg_id)
 
     def PassThruStartMsgFilter(
         self, channel_id, filter_type,
@@ -496,7 +633,7 @@ class J2534Dll(object):
                 byref(FilterID)
             ]
 
-        self._dll.PassThruStartMsgFilter(*args)
+        self._PassThruStartMsgFilter(*args)
 
         return FilterID
 
@@ -509,7 +646,7 @@ class J2534Dll(object):
             filter_id (int):
                 Handle to the periodic message to stop
         """
-        self._dll.PassThruStopMsgFilter(channel_id, filter_id)
+        self._PassThruStopMsgFilter(channel_id, filter_id)
 
     def PassThruSetProgrammingVoltage(self, device_id, pin_number, voltage):
         """Set the programming voltage on the specified pin on the specified device.
@@ -526,23 +663,13 @@ class J2534Dll(object):
                 it's desired to switch off the voltage or short the pin
                 to GND. Acceptable ranges are between 5000 and 20000.
         """
-        valid_voltages = range(
-            ProgrammingVoltage.MIN_VOLTAGE, ProgrammingVoltage.MAX_VOLTAGE + 1
-        )
-        if voltage not in (
-            [
-                ProgrammingVoltage.SHORT_TO_GROUND,
-                ProgrammingVoltage.VOLTAGE_OFF
-            ] + list(valid_voltages)
-        ):
-            raise ValueError(
-                '`voltage` must be between {} and {}'.format(
-                    ProgrammingVoltage.MIN_VOLTAGE.value,
-                    ProgrammingVoltage.MAX_VOLTAGE.value
-                )
-            )
+        low = ProgrammingVoltage.MIN_VOLTAGE
+        high = ProgrammingVoltage.MAX_VOLTAGE
+        in_range = low <= voltage <= high
+        if voltage not in _voltage_switches and not in_range:
+            raise ValueError(_voltage_error)
 
-        self._dll.PassThruSetProgrammingVoltage(
+        self._PassThruSetProgrammingVoltage(
             device_id, pin_number.value, voltage
         )
 
@@ -553,24 +680,24 @@ class J2534Dll(object):
             device_id (int): Handle to the previously opened device
 
         Returns:
-            tuple: 3-tuple of versions: (device firmware, DLL, and API)
+            tuple: 3-tuple of version bytes: (device firmware, DLL, and API)
         """
         fw_str = create_string_buffer(80)
         dll_str = create_string_buffer(80)
         api_str = create_string_buffer(80)
-        self._dll.PassThruReadVersion(
+        self._PassThruReadVersion(
             device_id, fw_str, dll_str, api_str
         )
-        return (fw_str, dll_str, api_str)
+        return (fw_str.value, dll_str.value, api_str.value)
 
     def PassThruGetLastError(self):
         """Get the last error message generated by the interface.
 
         Returns:
-            str: Error message
+            bytes: Error message
         """
         desc = create_string_buffer(80)
-        self._dll.PassThruGetLastError(desc)
+        self._PassThruGetLastError(desc)
         return desc.value
 
     def PassThruIoctlGetConfig(self, channel_id, params):
@@ -586,32 +713,27 @@ class J2534Dll(object):
             dict: dict mapping the requested :class:`.IoctlParameter` to
             their currently set int values
         """
-        _unused_params = set([
-            IoctlParameter.P1_MIN,
-            IoctlParameter.P2_MIN,
-            IoctlParameter.P2_MAX,
-            IoctlParameter.P3_MAX,
-            IoctlParameter.P4_MAX,
-        ])
-
-        _warn_params = set(params).intersection(_unused_params)
+        _params = set(params)
+
+        _warn_params = _params & _unused_params
         for p in _warn_params:
-            _logger.warn(
-                '{} not supported by interface, ignoring'.format(p.name)
+            _logger.warning(
+                '%s not supported by interface, ignoring', p.name
             )
 
-        _params = set(params) - _unused_params
-        ioctl_params = [
-            SCONFIG(par, 0) for par in _params if par not in _unused_params
-        ]
-        Input = SCONFIG_LIST(ioctl_params)
-        self._dll.PassThruIoctl(
+        _params -= _warn_params
+        if not _params:
+            return {}
+
+        Config = (SCONFIG*len(_params))(*[(par, 0) for par in _params])
+        Input = SCONFIG_LIST(Config)
+        self._PassThruIoctl(
             channel_id,
             IoctlID.GET_CONFIG,
             byref(Input),
             None
         )
-        return {IoctlParameter(x.Parameter): x.Value for x in Input.Config}
+        return {x.Parameter: x.Value for x in Config}
 
     def PassThruIoctlSetConfig(self, channel_id, params):
         """Set protocol configuration parameters for the given channel.
@@ -622,9 +744,9 @@ class J2534Dll(object):
             params (dict):
                 Mapping of :class:`.IoctlParameter` to desired values
         """
-        ioctl_params = [SCONFIG(par.value, val) for par, val in params.items()]
-        Input = SCONFIG_LIST(ioctl_params)
-        self._dll.PassThruIoctl(
+        Config = (SCONFIG*len(params))(*params.items())
+        Input = SCONFIG_LIST(Config)
+        self._PassThruIoctl(
             channel_id,
             IoctlID.SET_CONFIG,
             byref(Input),
@@ -640,14 +762,7 @@ class J2534Dll(object):
         Returns:
             int: Pin 16 voltage, in mV
         """
-        Output = c_ulong()
-        self._dll.PassThruIoctl(
-            device_id,
-            IoctlID.READ_VBATT,
-            None,
-            byref(Output)
-        )
-        return Output.value
+        return self._ioctl_read_value(device_id, IoctlID.READ_VBATT)
 
     def PassThruIoctlReadProgVoltage(self, device_id):
         """Read the programming voltage of the Pass-Thru device.
@@ -660,14 +775,7 @@ class J2534Dll(object):
         Returns:
             int: Programming voltage, in mV
         """
-        Output = c_ulong()
-        self._dll.PassThruIoctl(
-            device_id,
-            IoctlID.READ_PROG_VOLTAGE,
-            None,
-            byref(Output)
-        )
-        return Output.value
+        return self._ioctl_read_value(device_id, IoctlID.READ_PROG_VOLTAGE)
 
     def PassThruIoctlFiveBaudInit(self, channel_id, addr):
         """Initiate a five-baud initialization.
@@ -683,14 +791,15 @@ class J2534Dll(object):
         """
         Input = SBYTE_ARRAY(bytes([addr]))
         Output = SBYTE_ARRAY(b'\xff\xff')
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.FIVE_BAUD_INIT,
             byref(Input),
             byref(Output)
         )
+        return Output.Bytes
 
-    def PassThruIoctlFastInit(self, channel_id, msg=None):
+    def PassThruIoctlFastInit(self, channel_id, msg=None, want_response=True):
         """Initiate a fast initialization.
 
         Args:
@@ -698,19 +807,20 @@ class J2534Dll(object):
                 Handle to the previously opened channel
             msg (:class:`.PASSTHRU_MSG`):
                 Message to be sent to the ECU for initialization.
+            want_response (bool):
+                Whether a response from the ECU is expected
 
         Returns:
             :class:`.PASSTHRU_MSG`: If a response is expected, a
             :class:`.PASSTHRU_MSG` containing the response from the ECU,
             ``None`` otherwise.
         """
-        Input = PASSTHRU_MSG()
-        Output = PASSTHRU_MSG()
-        self._dll.PassThruIoctl(
+        Output = PASSTHRU_MSG() if want_response else None
+        self._PassThruIoctl(
             channel_id,
             IoctlID.FAST_INIT,
-            byref(Input) if Input is not None else None,
-            byref(Output)
+            byref(msg) if msg is not None else None,
+            byref(Output) if Output is not None else None
         )
         return Output
 
@@ -720,7 +830,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.CLEAR_TX_BUFFER,
             None,
@@ -733,7 +843,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.CLEAR_RX_BUFFER,
             None,
@@ -746,7 +856,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.CLEAR_PERIODIC_MSGS,
             None,
@@ -759,7 +869,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.CLEAR_MSG_FILTERS,
             None,
@@ -772,7 +882,7 @@ class J2534Dll(object):
         Args:
             channel_id (int): Handle to the previously opened channel
         """
-        self._dll.PassThruIoctl(
+        self._PassThruIoctl(
             channel_id,
             IoctlID.CLEAR_FUNCT_MSG_LOOKUP_TABLE,
             None,
@@ -785,11 +895,12 @@ class J2534Dll(object):
         Args:
             channel_id (int):
                 Handle to the previously opened channel
-            addrs (list):
-                list of int containing the addresses to be added
+            addrs (bytes):
+                the addresses to be added, as a bytes-like object or
+                list of int
         """
-        Input = SBYTE_ARRAY(bytes(addrs))
-        self._dll.PassThruIoctl(
+        Input = SBYTE_ARRAY(addrs)
+        self._PassThruIoctl(
             channel_id,
             IoctlID.ADD_TO_FUNCT_MSG_LOOKUP_TABLE,
             byref(Input),
@@ -802,11 +913,12 @@ class J2534Dll(object):
         Args:
             channel_id (int):
                 Handle to the previously opened channel
-            addrs (list):
-                list of int containing the addresses to be deleted
+            addrs (bytes):
+                the addresses to be deleted, as a bytes-like object or
+                list of int
         """
-        Input = SBYTE_ARRAY(bytes(addrs))
-        self._dll.PassThruIoctl(
+        Input = SBYTE_ARRAY(addrs)
+        self._PassThruIoctl(
             channel_id,
             IoctlID.DELETE_FROM_FUNCT_MSG_LOOKUP_TABLE,
             byref(Input),
@@ -17,6 +17,8 @@
 """This module provides helpers to easily handle J2534 errors"""
 
 from enum import IntEnum
+from operator import index
+from types import MappingProxyType
 
 
 class J2534Errors(IntEnum):
@@ -161,27 +163,69 @@ _error_msg_map = {
     J2534Errors.RESERVED_J2534_2: 'Reserved for SAE J2534-2',
 }
 
+# read-only, keyed by the plain int codes
+_error_msg_map = MappingProxyType({
+    code.value: msg for code, msg in _error_msg_map.items()
+})
+
+
+# start of each reserved range, as plain ints
+_reserved_1 = J2534Errors.RESERVED_J2534_1.value
+_reserved_2 = J2534Errors.RESERVED_J2534_2.value
+
+# messages for the contiguous codes up to RESERVED_J2534_1, indexed by code
+_error_msgs = tuple(_error_msg_map[code] for code in range(_reserved_1 + 1))
+
+# (code, member, message, rendered message) of each defined error code,
+# so a :class:`J2534Error` for a known code needs a single lookup
+_error_info = {
+    code.value: (
+        code.value,
+        code,
+        _error_msg_map[code.value],
+        f'[{code.name}] {_error_msg_map[code.value]}'
+    )
+    for code in J2534Errors
+}
+
+
+def _to_code(err):
+    """Normalise ``err`` to an unsigned 32-bit return code.
+
+    The DLL functions return a signed ``long``, so codes with the top bit
+    set come back negative.
+    """
+    return index(err) & 0xFFFFFFFF
+
 
 def _get_error_text(err):
 
-    if isinstance(err, int):
-        if err < J2534Errors.RESERVED_J2534_1:
-            errorID = J2534Errors(err)
-        elif err < J2534Errors.RESERVED_J2534_2:
-            errorID = J2534Errors.RESERVED_J2534_1
-        else:
-            errorID = J2534Errors.RESERVED_J2534_2
+    try:
+        err = _to_code(err)
+    except TypeError:
+        return f'Invalid error {err}'
 
-    elif isinstance(err, J2534Errors):
-        errorID = err
+    if err < len(_error_msgs):
+        return _error_msgs[err]
+    elif err < _reserved_2:
+        return _error_msgs[_reserved_1]
+    return _error_msg_map[_reserved_2]
 
-    else:
-        return 'Invalid error {}'.format(err)
 
-    return _error_msg_map.get(
-        errorID,
-        'Invalid or undefined error code 0x{:02x}'.format(err)
-    )
+def _get_error_code(err):
+    """Resolve a raw return code to its :class:`J2534Errors` member.
+
+    Codes without a member of their own resolve to the reserved range
+    they fall in.
+    """
+    err = _to_code(err)
+    code = J2534Errors._value2member_map_.get(err)
+    if code is None:
+        if err < _reserved_2:
+            code = J2534Errors.RESERVED_J2534_1
+        else:
+            code = J2534Errors.RESERVED_J2534_2
+    return code
 
 
 class LoadDLLError(Exception):
@@ -193,14 +237,23 @@ class J2534Error(Exception):
     """Exception raised when J2534 errors are not handled by the wrapper.
 
     Attributes:
-        error (:class:`J2534Errors`): error code
+        code (int): raw error code, as unsigned 32-bit
+        error (:class:`J2534Errors`): error code, or the reserved range
+            ``code`` falls in if it has no member of its own
         message (str): error description
     """
 
     def __init__(self, j2534_error):
-        """Initialize the exception with a :class:`J2534Errors`"""
-        self.error = j2534_error
-        self.message = _get_error_text(j2534_error)
-        super(J2534Error, self).__init__('[{}] {}'.format(
-            self.error.name, self.message)
-        )
+        """Initialize the exception with a :class:`J2534Errors` or int"""
+        info = _error_info.get(j2534_error)
+        if info is None:
+            code = _to_code(j2534_error)
+            error = _get_error_code(code)
+            message = _get_error_text(code)
+            info = (
+                code, error, message,
+                f'[{error.name}] {message} (0x{code:08x})'
+            )
+
+        self.code, self.error, self.message, formatted = info
+        super(J2534Error, self).__init__(formatted)